@@ -1,4 +1,6 @@
 import boto3
+from typing import List, Optional, Tuple
+from boto3.dynamodb.types import TypeSerializer
 from botocore.exceptions import ClientError
 from utils.utils import setup_logger
 
@@ -34,7 +36,125 @@ class DynamoTable:
         except ClientError as e:
             logger.error(f"Error updating item in {self.name}: {e}")
 
-    def delete_item_by_conditions(self, chat_id: int, conditions: dict) -> None:
+    @staticmethod
+    def _build_increment(values: dict, record_id: Optional[str] = None) -> dict:
+        """
+        Construye los parámetros de un `update_item` que suma `values` a sus columnas.
+
+        Si se entrega `record_id`, la actualización es condicional: se rechaza si ese
+        registro ya fue sumado (reintentos del webhook de Telegram). Cada ID aplicado
+        se marca con su propio atributo `rid#<record_id>`, así `UPDATED_NEW` solo
+        retorna las columnas sumadas y la marca, no el historial de IDs. Un monto
+        negativo se rechaza si dejaría su columna bajo cero.
+
+        Las marcas hacen crecer el ítem ~20 bytes por evento: con el límite de 400 KB
+        de DynamoDB caben del orden de 20.000 eventos por ítem (un mes de un chat), y
+        cada update consume 1 WCU por KB del ítem.
+        """
+        additions = []
+        conditions = []
+        attribute_names = {}
+        attribute_values = {}
+        for index, (column, value) in enumerate(values.items()):
+            attribute_names[f"#col{index}"] = column
+            attribute_values[f":val{index}"] = value
+            additions.append(f"#col{index} :val{index}")
+            if value < 0:
+                attribute_values[f":min{index}"] = -value
+                conditions.append(f"#col{index} >= :min{index}")
+
+        update_expression = "ADD " + ", ".join(additions)
+        if record_id is not None:
+            update_expression += " SET #rid = :applied"
+            attribute_names["#rid"] = f"rid#{record_id}"
+            attribute_values[":applied"] = True
+            conditions.insert(0, "attribute_not_exists(#rid)")
+
+        params = {
+            "UpdateExpression": update_expression,
+            "ExpressionAttributeNames": attribute_names,
+            "ExpressionAttributeValues": attribute_values,
+        }
+        if conditions:
+            params["ConditionExpression"] = " AND ".join(conditions)
+        return params
+
+    def increment_values(
+        self, key: dict, values: dict, record_id: Optional[str] = None
+    ) -> dict:
+        """
+        Suma de forma atómica, en un solo `update_item`, montos a columnas numéricas
+        de un ítem y retorna los nuevos totales.
+
+        Args:
+            key (dict): Llave primaria del ítem.
+            values (dict): Monto a sumar por columna (negativo para restar); las
+                columnas se crean en 0 si no existen.
+            record_id (Optional[str]): ID único del evento que origina el incremento.
+
+        Returns:
+            dict: Nuevo valor de cada columna, vacío si no se actualizó.
+        """
+        try:
+            response = self.table.update_item(
+                Key=key,
+                ReturnValues="UPDATED_NEW",
+                **self._build_increment(values, record_id),
+            )
+            attributes = response.get("Attributes", {})
+            return {column: attributes.get(column) for column in values}
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                logger.warning(f"Increment of {key} rejected in {self.name}: {e}")
+            else:
+                logger.error(f"Error incrementing item in {self.name}: {e}")
+            return {}
+
+    def increment_values_transaction(
+        self, updates: List[Tuple[dict, dict]], record_id: Optional[str] = None
+    ) -> dict:
+        """
+        Aplica `increment_values` sobre varios ítems en una sola transacción.
+
+        Args:
+            updates (List[Tuple[dict, dict]]): Pares (llave, montos por columna).
+            record_id (Optional[str]): ID único del evento que origina el incremento.
+
+        Returns:
+            dict: Nuevo valor de las columnas del primer ítem, vacío si no se actualizó.
+        """
+        serializer = TypeSerializer()
+        transact_items = []
+        for key, values in updates:
+            params = self._build_increment(values, record_id)
+            params["ExpressionAttributeValues"] = {
+                name: serializer.serialize(value)
+                for name, value in params["ExpressionAttributeValues"].items()
+            }
+            transact_items.append(
+                {
+                    "Update": {
+                        "TableName": self.name,
+                        "Key": {k: serializer.serialize(v) for k, v in key.items()},
+                        **params,
+                    }
+                }
+            )
+
+        try:
+            self.dynamodb.meta.client.transact_write_items(TransactItems=transact_items)
+            key, values = updates[0]
+            response = self.table.get_item(Key=key, ConsistentRead=True)
+            item = response.get("Item", {})
+            return {column: item.get(column) for column in values}
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "TransactionCanceledException":
+                logger.warning(f"Transaction rejected in {self.name}: {e}")
+            else:
+                logger.error(f"Error in transaction on {self.name}: {e}")
+            return {}
+
+    def delete_item_by_conditions(self, chat_id: int, conditions: dict) -> bool:
         """
         Elimina un ítem basado en el `chat_id` y condiciones adicionales si no se conoce el `record_id`.
 
@@ -45,6 +165,9 @@ class DynamoTable:
                 - amount
                 - date
                 - description
+
+        Returns:
+            bool: True si se eliminó un ítem, False en caso contrario.
         """
         try:
             # Paso 1: Consultar ítems por `chat_id`
@@ -76,12 +199,28 @@ class DynamoTable:
                     }
                 )
                 logger.info(f"Item eliminado con éxito: {item_to_delete}")
+                return True
             else:
                 logger.warning("No se encontró un ítem que cumpla con las condiciones.")
         except ClientError as e:
             logger.error(
                 f"Error al eliminar el ítem con condiciones de {self.name}: {e}"
             )
+        return False
+
+    def get_item(self, chat_id: int, record_id: Optional[int] = None) -> dict:
+        """
+        Recupera el ítem completo para un `chat_id` (y `record_id` si la tabla lo usa).
+        """
+        key = {"chat_id": chat_id}
+        if record_id is not None:
+            key["record_id"] = record_id
+        try:
+            response = self.table.get_item(Key=key)
+            return response.get("Item", {})
+        except ClientError as e:
+            logger.error(f"Error fetching item from {self.name}: {e}")
+            return {}
 
     def get_value(self, chat_id: int, column: str) -> dict:
         """
@@ -10,6 +10,8 @@ from utils.utils import (
     is_google_sheet_url,
     extract_sheet_id_from_message,
     extract_data_from_message,
+    get_budget_period,
+    build_budget_alert,
 )
 from datetime import datetime
 
@@ -25,6 +27,7 @@ def lambda_handler(event, context):
     # Init classes
     user_session_table = DynamoTable("TelegramBotUserSession")
     user_expenses_table = DynamoTable("TelegramBotUserExpenses")
+    user_totals_table = DynamoTable("TelegramBotUserMonthlyTotals")
     telegram_api = TelegramAPI(BOT_TOKEN)
 
     # Get body from event
@@ -49,6 +52,8 @@ def lambda_handler(event, context):
         user_name = body[key_date]["from"]["username"]
         message_text = body[key_date]["text"]
         message_date = body[key_date]["date"]
+        message_id = body[key_date]["message_id"]
+        edit_date = body[key_date].get("edit_date")
         inline_action = None
 
     logger.info("chat id: %s", chat_id)
@@ -77,7 +82,16 @@ def lambda_handler(event, context):
 
         # Eliminar el registro de DynamoDB
         data = extract_data_from_message(message_text)
-        user_expenses_table.delete_item_by_conditions(chat_id, data)
+        deleted = user_expenses_table.delete_item_by_conditions(chat_id, data)
+
+        # Descontar el monto del total mensual de la categoría (una vez por mensaje)
+        period = get_budget_period(data["date"])
+        if deleted and period:
+            user_totals_table.increment_values(
+                key={"chat_id": chat_id, "period": period},
+                values={data["category"]: -int(data["amount"])},
+                record_id=f"delete-{message_id}",
+            )
 
         return {"statusCode": 200, "body": json.dumps("Message processed successfully")}
 
@@ -112,13 +126,9 @@ def lambda_handler(event, context):
     elif is_google_sheet_url(message_text):
         sheet_id = extract_sheet_id_from_message(message_text)
         if sheet_id:
-            user_session_table.put_item(
-                item={
-                    "chat_id": chat_id,
-                    "sheet_id": sheet_id,
-                    "selected_category": None,
-                }
-            )
+            # Se actualizan solo estas columnas para conservar los presupuestos
+            user_session_table.update_item(chat_id, "sheet_id", sheet_id)
+            user_session_table.update_item(chat_id, "selected_category", None)
             reply_message = f"✅ Google Sheet ID guardado correctamente. Ya puedes registrar tus gastos, selecciona una categoría:"
             telegram_api.send_reply(chat_id, reply_message)
         else:
@@ -132,6 +142,47 @@ def lambda_handler(event, context):
         reply_message = f"✅ Has seleccionado la categoría: {message_text} 📂\n📝 Ahora envía un mensaje en el formato:\n📍 DD-MM descripción monto 💰"
         telegram_api.send_reply(chat_id, reply_message)
 
+    elif message_text.lower().startswith("/presupuesto"):
+        # Formato: /presupuesto <categoría> <monto>, monto 0 elimina el presupuesto
+        match_budget = re.match(r"/presupuesto (.+) (\d+)$", message_text, re.I)
+        if not match_budget:
+            telegram_api.send_reply(
+                chat_id,
+                "❌ Formato inválido. Por favor, envía un mensaje en el formato:\n📝 /presupuesto categoría monto",
+            )
+            return
+
+        category_text, budget = match_budget.groups()
+        category = next(
+            (
+                item
+                for sublist in CATEGORIES
+                for item in sublist
+                if item.lower() == category_text.strip().lower()
+            ),
+            None,
+        )
+        if not category:
+            telegram_api.send_reply(
+                chat_id,
+                f"❌ Categoría desconocida: {category_text} 📂\nUsa una de las categorías del menú.",
+            )
+            return
+
+        # Los presupuestos se guardan junto a la sesión del usuario
+        budgets = user_session_table.get_value(chat_id, "budgets") or {}
+        if int(budget) > 0:
+            budgets[category] = int(budget)
+            reply_message = (
+                f"✅ Presupuesto mensual de {category} 📂 definido en ${budget} 💰"
+            )
+        else:
+            budgets.pop(category, None)
+            reply_message = f"🗑️ Presupuesto mensual de {category} 📂 eliminado"
+        user_session_table.update_item(chat_id, "budgets", budgets)
+
+        telegram_api.send_reply(chat_id, reply_message)
+
     else:
         # Primero intentar con formato fecha + descripción + monto
         match_with_date = re.match(r"(\d{1,2}-\d{1,2}) (.+) (\d+)", message_text)
@@ -156,8 +207,18 @@ def lambda_handler(event, context):
             description, amount = match_without_date.groups()
             date = datetime.now().strftime("%d-%m-%Y")
 
+        # Validar la fecha antes de guardar el registro
+        period = get_budget_period(date)
+        if not period:
+            telegram_api.send_reply(
+                chat_id,
+                "❌ Formato inválido. La fecha no existe, envía un mensaje en el formato:\n📝 DD-MM descripción monto",
+            )
+            return
+
         # Verificar que haya una categoría seleccionada
-        category = user_session_table.get_value(chat_id, "selected_category")
+        session = user_session_table.get_item(chat_id)
+        category = session.get("selected_category")
         if not category:
             telegram_api.send_reply(
                 chat_id,
@@ -165,6 +226,42 @@ def lambda_handler(event, context):
             )
             return
 
+        # Actualizar el total mensual de la categoría antes de cualquier otra escritura,
+        # así un reintento del webhook repite la misma actualización (idempotente por
+        # `record_id`) aunque falle Google Sheets o Telegram
+        record_id = str(message_id)
+        key = {"chat_id": chat_id, "period": period}
+        changes = {category: int(amount)}
+        old_changes = None
+        unchanged_edit = False
+        if key_date == "edited_message":
+            # La edición reemplaza el registro original: se descuenta el monto anterior
+            record_id = f"{message_id}-{edit_date}"
+            old_item = user_expenses_table.get_item(chat_id, record_id=message_date)
+            unchanged_edit = (
+                old_item.get("category") == category
+                and old_item.get("date") == date
+                and old_item.get("amount") == amount
+            )
+            old_period = get_budget_period(old_item.get("date", ""))
+            if old_period == period:
+                # Mismo mes: un único update sobre el mismo ítem
+                old_category = old_item["category"]
+                old_amount = int(old_item["amount"])
+                changes[old_category] = changes.get(old_category, 0) - old_amount
+            elif old_period:
+                old_changes = {old_item["category"]: -int(old_item["amount"])}
+
+        if old_changes:
+            # Cambio de mes: ambos ítems se actualizan en una transacción
+            old_key = {"chat_id": chat_id, "period": old_period}
+            totals = user_totals_table.increment_values_transaction(
+                [(key, changes), (old_key, old_changes)], record_id=record_id
+            )
+        else:
+            totals = user_totals_table.increment_values(key, changes, record_id)
+        total = totals.get(category)
+
         # Guardar en DynamoDB
         user_expenses_table.put_item(
             item={
@@ -197,4 +294,14 @@ def lambda_handler(event, context):
         buttons = [[{"text": "Eliminar", "callback_data": "delete_record"}]]
         telegram_api.send_reply(chat_id, reply_message, buttons=buttons)
 
+        # Alertar si el gasto supera un umbral del presupuesto, comparando el total
+        # antes y después del cambio realmente aplicado (en una edición, la diferencia)
+        budget = session.get("budgets", {}).get(category)
+        if total is not None and budget and not unchanged_edit:
+            alert_message = build_budget_alert(
+                category, period, int(total), changes[category], int(budget)
+            )
+            if alert_message:
+                telegram_api.send_reply(chat_id, alert_message)
+
     return {"statusCode": 200, "body": json.dumps("Message processed successfully")}
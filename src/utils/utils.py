@@ -1,7 +1,11 @@
 import logging
 import re
+from datetime import datetime
 from typing import Optional
 
+# Umbrales de alerta de presupuesto, de mayor a menor
+BUDGET_THRESHOLDS = [1.0, 0.8]
+
 
 def extract_cell_range_from_message(message: str) -> Optional[str]:
     """
@@ -83,6 +87,55 @@ def extract_sheet_id_from_message(message: str) -> Optional[str]:
     return None
 
 
+def get_budget_period(date: str) -> Optional[str]:
+    """
+    Obtiene el periodo mensual (YYYY-MM) de una fecha en formato DD-MM-YYYY.
+
+    Args:
+        date (str): Fecha del gasto (ej: '5-1-2025').
+
+    Returns:
+        Optional[str]: Periodo del gasto (ej: '2025-01'), None si la fecha no es válida.
+    """
+    try:
+        return datetime.strptime(date, "%d-%m-%Y").strftime("%Y-%m")
+    except ValueError:
+        return None
+
+
+def build_budget_alert(
+    category: str, period: str, total: float, amount: float, budget: float
+) -> Optional[str]:
+    """
+    Construye un mensaje de alerta si el gasto hace que la categoría cruce un umbral
+    de su presupuesto mensual.
+
+    Args:
+        category (str): Categoría del gasto.
+        period (str): Periodo del gasto (YYYY-MM).
+        total (float): Total acumulado del mes incluyendo el gasto.
+        amount (float): Monto del gasto.
+        budget (float): Presupuesto mensual de la categoría.
+
+    Returns:
+        Optional[str]: Mensaje de alerta, None si no se cruzó ningún umbral.
+    """
+    if not budget or budget <= 0:
+        return None
+
+    previous_total = total - amount
+    for threshold in BUDGET_THRESHOLDS:
+        limit = budget * threshold
+        if previous_total < limit <= total:
+            percentage = int(total * 100 / budget)
+            icon = "🚨" if threshold >= 1 else "⚠️"
+            return (
+                f"{icon} Llevas ${total} de ${budget} en {category} "
+                f"para {period} ({percentage}%)"
+            )
+    return None
+
+
 def setup_logger(name):
     """
     Configura un logger con un formato que incluye el nombre del archivo,
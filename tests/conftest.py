@@ -0,0 +1,31 @@
+import importlib
+import os
+import sys
+from unittest import mock
+
+import pytest
+
+# Los módulos de la Lambda se importan relativos a `src/`
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+
+@pytest.fixture
+def dynamo():
+    """
+    Importa `db.dynamo` con `boto3.resource` reemplazado, ya que el módulo crea el
+    recurso de DynamoDB (y ejecuta llamadas a la tabla) al importarse.
+    """
+    with mock.patch("boto3.resource"):
+        sys.modules.pop("db.dynamo", None)
+        yield importlib.import_module("db.dynamo")
+    sys.modules.pop("db.dynamo", None)
+
+
+@pytest.fixture
+def lambda_function(dynamo, monkeypatch):
+    """Importa `lambda_function` con las variables de entorno requeridas."""
+    monkeypatch.setenv("BOT_TOKEN", "token")
+    monkeypatch.setenv("GCP_MAIL_EDITOR", "editor@example.com")
+    sys.modules.pop("lambda_function", None)
+    yield importlib.import_module("lambda_function")
+    sys.modules.pop("lambda_function", None)
@@ -0,0 +1,91 @@
+from unittest import mock
+
+import pytest
+from botocore.exceptions import ClientError
+
+KEY = {"chat_id": 1, "period": "2025-01"}
+
+
+@pytest.fixture
+def totals_table(dynamo):
+    table = dynamo.DynamoTable("TelegramBotUserMonthlyTotals")
+    table.table = mock.Mock()
+    return table
+
+
+def conditional_check_failed(operation):
+    return ClientError(
+        {"Error": {"Code": "ConditionalCheckFailedException", "Message": ""}},
+        operation,
+    )
+
+
+def test_build_increment_new_expense(dynamo):
+    params = dynamo.DynamoTable._build_increment({"Metro": 100}, "42")
+
+    assert params == {
+        "UpdateExpression": "ADD #col0 :val0 SET #rid = :applied",
+        "ExpressionAttributeNames": {"#col0": "Metro", "#rid": "rid#42"},
+        "ExpressionAttributeValues": {":val0": 100, ":applied": True},
+        "ConditionExpression": "attribute_not_exists(#rid)",
+    }
+
+
+def test_build_increment_guards_negative_values(dynamo):
+    params = dynamo.DynamoTable._build_increment({"Metro": 50, "Almuerzo": -30}, "7")
+
+    assert params["UpdateExpression"] == (
+        "ADD #col0 :val0, #col1 :val1 SET #rid = :applied"
+    )
+    assert params["ExpressionAttributeNames"]["#col1"] == "Almuerzo"
+    assert params["ExpressionAttributeValues"][":min1"] == 30
+    assert params["ConditionExpression"] == (
+        "attribute_not_exists(#rid) AND #col1 >= :min1"
+    )
+
+
+def test_build_increment_without_record_id(dynamo):
+    params = dynamo.DynamoTable._build_increment({"Metro": 10})
+
+    assert params["UpdateExpression"] == "ADD #col0 :val0"
+    assert "ConditionExpression" not in params
+
+
+def test_increment_values_returns_new_totals(totals_table):
+    totals_table.table.update_item.return_value = {
+        "Attributes": {"Metro": 900, "rid#42": True}
+    }
+
+    assert totals_table.increment_values(KEY, {"Metro": 100}, "42") == {"Metro": 900}
+    kwargs = totals_table.table.update_item.call_args.kwargs
+    assert kwargs["Key"] == KEY
+    assert kwargs["ReturnValues"] == "UPDATED_NEW"
+    assert kwargs["ConditionExpression"] == "attribute_not_exists(#rid)"
+
+
+def test_increment_values_redelivered_record(totals_table):
+    totals_table.table.update_item.side_effect = conditional_check_failed("UpdateItem")
+
+    assert totals_table.increment_values(KEY, {"Metro": 100}, "42") == {}
+
+
+def test_increment_values_transaction_serializes_updates(totals_table):
+    client = totals_table.dynamodb.meta.client
+    client.reset_mock()
+    totals_table.table.get_item.return_value = {"Item": {"Metro": 300}}
+    old_key = {"chat_id": 1, "period": "2024-12"}
+
+    totals = totals_table.increment_values_transaction(
+        [(KEY, {"Metro": 300}), (old_key, {"Metro": -300})], "42-1700"
+    )
+
+    assert totals == {"Metro": 300}
+    items = client.transact_write_items.call_args.kwargs["TransactItems"]
+    assert [item["Update"]["Key"]["period"] for item in items] == [
+        {"S": "2025-01"},
+        {"S": "2024-12"},
+    ]
+    assert items[1]["Update"]["ExpressionAttributeValues"][":val0"] == {"N": "-300"}
+    assert items[1]["Update"]["ConditionExpression"] == (
+        "attribute_not_exists(#rid) AND #col0 >= :min0"
+    )
@@ -0,0 +1,177 @@
+import json
+from datetime import datetime
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+
+CHAT_ID = 1
+CATEGORY = "Supermercado"
+# Los gastos `DD-MM` se registran en el año actual
+YEAR = datetime.now().year
+PERIOD = f"{YEAR}-01"
+
+
+@pytest.fixture
+def services(lambda_function, monkeypatch):
+    """Reemplaza las tablas de DynamoDB, Google Sheets y Telegram por mocks."""
+    manager = mock.Mock()
+    monkeypatch.setattr(
+        lambda_function, "DynamoTable", lambda name: getattr(manager, name)
+    )
+    monkeypatch.setattr(lambda_function, "GoogleSheets", lambda _: manager.sheets)
+    monkeypatch.setattr(lambda_function, "TelegramAPI", lambda _: manager.telegram)
+
+    manager.TelegramBotUserSession.get_value.return_value = "sheet-id"
+    manager.TelegramBotUserSession.get_item.return_value = {
+        "selected_category": CATEGORY,
+        "budgets": {CATEGORY: Decimal(1000)},
+    }
+    manager.sheets.append_expenses.return_value = "Records!A2:D2"
+    return manager
+
+
+def message_event(text, message_id=42, edit_date=None):
+    key = "edited_message" if edit_date else "message"
+    message = {
+        "message_id": message_id,
+        "chat": {"id": CHAT_ID},
+        "from": {"username": "user"},
+        "text": text,
+        "date": 1736000000,
+    }
+    if edit_date:
+        message["edit_date"] = edit_date
+    return {"body": json.dumps({key: message})}
+
+
+def sent_messages(services):
+    return [c.args[1] for c in services.telegram.send_reply.call_args_list]
+
+
+def test_new_expense_updates_total_before_other_io(lambda_function, services):
+    totals = services.TelegramBotUserMonthlyTotals
+    totals.increment_values.return_value = {CATEGORY: Decimal(850)}
+
+    lambda_function.lambda_handler(message_event("05-01 pan 100"), None)
+
+    totals.increment_values.assert_called_once_with(
+        {"chat_id": CHAT_ID, "period": PERIOD}, {CATEGORY: 100}, "42"
+    )
+    calls = [name for name, _, _ in services.mock_calls]
+    assert calls.index("TelegramBotUserMonthlyTotals.increment_values") < min(
+        calls.index("TelegramBotUserExpenses.put_item"),
+        calls.index("sheets.append_expenses"),
+        calls.index("telegram.send_reply"),
+    )
+    assert PERIOD in sent_messages(services)[-1]
+    assert sent_messages(services)[-1].startswith("⚠️")
+
+
+def test_redelivered_expense_does_not_alert(lambda_function, services):
+    # El update condicional rechaza el `record_id` ya aplicado
+    services.TelegramBotUserMonthlyTotals.increment_values.return_value = {}
+
+    lambda_function.lambda_handler(message_event("05-01 pan 100"), None)
+
+    services.TelegramBotUserMonthlyTotals.increment_values.assert_called_once_with(
+        {"chat_id": CHAT_ID, "period": PERIOD}, {CATEGORY: 100}, "42"
+    )
+    assert len(sent_messages(services)) == 1
+
+
+def test_invalid_date_is_rejected_before_writing(lambda_function, services):
+    lambda_function.lambda_handler(message_event("31-02 pan 100"), None)
+
+    services.TelegramBotUserMonthlyTotals.increment_values.assert_not_called()
+    services.TelegramBotUserExpenses.put_item.assert_not_called()
+    services.sheets.append_expenses.assert_not_called()
+    assert sent_messages(services)[0].startswith("❌ Formato inválido")
+
+
+def test_amount_edit_applies_delta_in_single_update(lambda_function, services):
+    services.TelegramBotUserExpenses.get_item.return_value = {
+        "category": CATEGORY,
+        "date": f"05-01-{YEAR}",
+        "amount": "900",
+    }
+    totals = services.TelegramBotUserMonthlyTotals
+    totals.increment_values.return_value = {CATEGORY: Decimal(950)}
+
+    lambda_function.lambda_handler(
+        message_event("05-01 pan 950", edit_date=1736000100), None
+    )
+
+    services.TelegramBotUserExpenses.get_item.assert_called_once_with(
+        CHAT_ID, record_id=1736000000
+    )
+    totals.increment_values.assert_called_once_with(
+        {"chat_id": CHAT_ID, "period": PERIOD}, {CATEGORY: 50}, "42-1736000100"
+    )
+    totals.increment_values_transaction.assert_not_called()
+    # El 80% ya se había cruzado con 900: no se repite la alerta
+    assert len(sent_messages(services)) == 1
+
+
+def test_edit_to_another_month_uses_transaction(lambda_function, services):
+    services.TelegramBotUserExpenses.get_item.return_value = {
+        "category": CATEGORY,
+        "date": f"31-12-{YEAR}",
+        "amount": "100",
+    }
+    totals = services.TelegramBotUserMonthlyTotals
+    totals.increment_values_transaction.return_value = {CATEGORY: Decimal(100)}
+
+    lambda_function.lambda_handler(
+        message_event("05-01 pan 100", edit_date=1736000100), None
+    )
+
+    totals.increment_values.assert_not_called()
+    totals.increment_values_transaction.assert_called_once_with(
+        [
+            ({"chat_id": CHAT_ID, "period": PERIOD}, {CATEGORY: 100}),
+            ({"chat_id": CHAT_ID, "period": f"{YEAR}-12"}, {CATEGORY: -100}),
+        ],
+        record_id="42-1736000100",
+    )
+
+
+def delete_event():
+    text = (
+        "✅ Registro agregado exitosamente:\n"
+        f"📂 Categoría: {CATEGORY}\n"
+        "📅 Fecha: 05-01-2025\n"
+        "📝 Descripción: pan\n"
+        "💰 Monto: $100\n"
+        "📊 Celda: Records!A2:D2"
+    )
+    callback = {
+        "data": "delete_record",
+        "message": {
+            "message_id": 43,
+            "chat": {"id": CHAT_ID, "username": "user"},
+            "text": text,
+            "date": 1736000001,
+        },
+    }
+    return {"body": json.dumps({"callback_query": callback})}
+
+
+def test_delete_decrements_total_once(lambda_function, services):
+    services.TelegramBotUserExpenses.delete_item_by_conditions.return_value = True
+
+    lambda_function.lambda_handler(delete_event(), None)
+
+    services.TelegramBotUserMonthlyTotals.increment_values.assert_called_once_with(
+        key={"chat_id": CHAT_ID, "period": "2025-01"},
+        values={CATEGORY: -100},
+        record_id="delete-43",
+    )
+
+
+def test_delete_without_matching_expense_keeps_total(lambda_function, services):
+    services.TelegramBotUserExpenses.delete_item_by_conditions.return_value = False
+
+    lambda_function.lambda_handler(delete_event(), None)
+
+    services.TelegramBotUserMonthlyTotals.increment_values.assert_not_called()
@@ -0,0 +1,56 @@
+import pytest
+
+from utils.utils import build_budget_alert, get_budget_period
+
+
+@pytest.mark.parametrize(
+    "date, expected",
+    [
+        ("5-1-2025", "2025-01"),
+        ("31-12-2025", "2025-12"),
+        ("29-02-2024", "2024-02"),
+    ],
+)
+def test_get_budget_period(date, expected):
+    assert get_budget_period(date) == expected
+
+
+@pytest.mark.parametrize("date", ["31-02-2026", "45-13-2025", "29-02-2025", ""])
+def test_get_budget_period_invalid_date(date):
+    assert get_budget_period(date) is None
+
+
+def test_build_budget_alert_below_threshold():
+    assert build_budget_alert("Metro", "2025-01", 700, 100, 1000) is None
+
+
+def test_build_budget_alert_crosses_warning_threshold():
+    alert = build_budget_alert("Metro", "2025-01", 850, 100, 1000)
+    assert alert.startswith("⚠️")
+    assert "Metro" in alert
+    assert "2025-01" in alert
+    assert "85%" in alert
+
+
+def test_build_budget_alert_exactly_at_limit():
+    assert build_budget_alert("Metro", "2025-01", 800, 100, 1000).startswith("⚠️")
+    assert build_budget_alert("Metro", "2025-01", 1000, 200, 1000).startswith("🚨")
+
+
+def test_build_budget_alert_crosses_both_thresholds_reports_budget_exceeded():
+    alert = build_budget_alert("Metro", "2025-01", 1200, 500, 1000)
+    assert alert.startswith("🚨")
+    assert "120%" in alert
+
+
+def test_build_budget_alert_already_over_budget():
+    assert build_budget_alert("Metro", "2025-01", 1300, 100, 1000) is None
+
+
+def test_build_budget_alert_decrease_does_not_alert():
+    assert build_budget_alert("Metro", "2025-01", 900, -200, 1000) is None
+
+
+@pytest.mark.parametrize("budget", [0, None])
+def test_build_budget_alert_without_budget(budget):
+    assert build_budget_alert("Metro", "2025-01", 900, 100, budget) is None